@@ -0,0 +1,29 @@
+"""Shared HTTP session for the newsletter pipeline."""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src import config
+
+
+# One session for the whole process: keep-alive reuses TCP/TLS
+# connections across requests to the same host, and the adapter retries
+# transient server errors with backoff. Rate-limit responses (429/503)
+# are deliberately not retried here: the downloader's rate limiter
+# handles those so the backoff applies to every worker thread, not just
+# the request that hit the limit.
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": "Mozilla/5.0"})
+
+_adapter = HTTPAdapter(
+    pool_connections=config.DOWNLOAD_WORKERS,
+    pool_maxsize=config.DOWNLOAD_WORKERS * 2,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[500, 502, 504],
+    ),
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
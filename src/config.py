@@ -1,5 +1,6 @@
 """Configuration settings for the AI newsletter system."""
 
+import functools
 import os
 from datetime import datetime
 
@@ -12,12 +13,22 @@ ARXIV_PDF_BASE_URL = "https://arxiv.org/pdf"
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DATA_DIR = os.path.join(PROJECT_ROOT, "data")
 PAPERS_DIR = os.path.join(DATA_DIR, "papers")
+SUMMARIES_DIR = os.path.join(DATA_DIR, "summaries")
 
 # Scraping settings
 TOP_N_PAPERS = 5
 REQUEST_TIMEOUT = 30  # seconds
 
+# Download settings
+DOWNLOAD_WORKERS = 4  # concurrent arXiv downloads
+ARXIV_MIN_REQUEST_INTERVAL = 0.5  # seconds between requests to arXiv
+ARXIV_BACKOFF_INTERVAL = 3.0  # spacing when arXiv looks slow or unhappy
+ARXIV_SLOW_RESPONSE_THRESHOLD = 0.5  # seconds; slower responses trigger backoff
 
+
+# Cached for the life of the process: the week only changes on restart,
+# which matches the weekly run cadence.
+@functools.lru_cache(maxsize=1)
 def get_current_week_url():
     """Generates the HuggingFace URL for the current week.
 
@@ -35,6 +46,7 @@ def get_current_week_url():
     return f"{HUGGINGFACE_BASE_URL}/{year}-W{week}"
 
 
+@functools.lru_cache(maxsize=1)
 def get_week_folder_name():
     """Generates the folder name for storing current week's papers.
 
@@ -53,6 +65,7 @@ def get_week_folder_name():
 def ensure_directories_exist():
     """Creates necessary directories if they don't exist."""
     os.makedirs(PAPERS_DIR, exist_ok=True)
+    os.makedirs(SUMMARIES_DIR, exist_ok=True)
 
 
 # LLM settings
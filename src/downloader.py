@@ -2,13 +2,15 @@
 
 import logging
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
 
-import fitz  # PyMuPDF - pylint: disable=import-error
 import requests
 
 from src import config
+from src._http import SESSION
 
 
 logging.basicConfig(
@@ -17,6 +19,64 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+class _RateLimiter:
+    """Enforces a minimum interval between outgoing requests.
+
+    Keeps the politeness delay toward arXiv without serializing the
+    whole download pipeline the way a fixed per-paper sleep does.
+
+    Attributes:
+        min_interval: Minimum seconds between requests.
+    """
+
+    def __init__(self, min_interval: float):
+        """Initializes the rate limiter.
+
+        Args:
+            min_interval: Minimum number of seconds between requests.
+        """
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_allowed = 0.0
+
+    def wait(self):
+        """Blocks until the caller is allowed to make a request."""
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_allowed - now
+            self._next_allowed = max(now, self._next_allowed) + self.min_interval
+        if delay > 0:
+            time.sleep(delay)
+
+    def backoff(self, seconds: float):
+        """Pushes the next allowed request at least this far out.
+
+        Args:
+            seconds: Minimum delay before the next request.
+        """
+        with self._lock:
+            self._next_allowed = max(self._next_allowed, time.monotonic() + seconds)
+
+    def record_response(self, elapsed: float, ok: bool):
+        """Adapts the request spacing to how the server is responding.
+
+        Fast healthy responses keep the short interval; slow or failed
+        ones fall back to conservative spacing.
+
+        Args:
+            elapsed: Seconds the last request took.
+            ok: Whether the last request succeeded.
+        """
+        with self._lock:
+            if ok and elapsed < config.ARXIV_SLOW_RESPONSE_THRESHOLD:
+                self.min_interval = config.ARXIV_MIN_REQUEST_INTERVAL
+            else:
+                self.min_interval = config.ARXIV_BACKOFF_INTERVAL
+
+
+_rate_limiter = _RateLimiter(config.ARXIV_MIN_REQUEST_INTERVAL)
+
+
 class PaperDownloader:
     """Downloads papers from arXiv and extracts text content.
 
@@ -35,6 +95,7 @@ class PaperDownloader:
         self.paper_id = paper_id
         self.save_dir = save_dir
         self.pdf_path = os.path.join(save_dir, f"{paper_id}.pdf")
+        self.text_path = os.path.join(save_dir, f"{paper_id}.txt")
 
     def download_pdf(self) -> bool:
         """Downloads the PDF from arXiv.
@@ -45,17 +106,33 @@ class PaperDownloader:
         url = f"{config.ARXIV_PDF_BASE_URL}/{self.paper_id}.pdf"
 
         try:
+            _rate_limiter.wait()
             logger.info("Downloading paper %s from %s", self.paper_id, url)
-            response = requests.get(
-                url,
-                timeout=config.REQUEST_TIMEOUT,
-                headers={"User-Agent": "Mozilla/5.0"},
-            )
+            started = time.monotonic()
+            response = SESSION.get(url, stream=True, timeout=config.REQUEST_TIMEOUT)
+            elapsed = time.monotonic() - started
+
+            # Honor an explicit rate-limit signal before giving up; the
+            # backoff also delays the other download threads
+            if response.status_code in (429, 503):
+                header = response.headers.get("Retry-After", "")
+                retry_after = float(header) if header.isdigit() else 30.0
+                logger.warning(
+                    "arXiv returned %d for %s, backing off %.0fs",
+                    response.status_code,
+                    self.paper_id,
+                    retry_after,
+                )
+                _rate_limiter.backoff(retry_after)
+
+            _rate_limiter.record_response(elapsed, response.status_code == 200)
             response.raise_for_status()
 
-            # Save the PDF
+            # Stream the PDF to disk in chunks instead of buffering the
+            # whole file in memory first
             with open(self.pdf_path, "wb") as file:
-                file.write(response.content)
+                for chunk in response.iter_content(chunk_size=65536):
+                    file.write(chunk)
 
             logger.info("Downloaded PDF to %s", self.pdf_path)
             return True
@@ -64,12 +141,19 @@ class PaperDownloader:
             logger.error("Error downloading %s: %s", self.paper_id, error)
             return False
 
-    def extract_text(self) -> Optional[str]:
-        """Extracts text content from the downloaded PDF.
+    def extract_pages(self) -> Optional[list[str]]:
+        """Extracts text from the downloaded PDF, one string per page.
+
+        Keeping pages separate lets callers feed them straight into the
+        tokenizer without materializing the full-paper string.
 
         Returns:
-            The extracted text as a string, or None if extraction fails.
+            A list of per-page text strings, or None if extraction fails.
         """
+        # Imported here so download-only and scraper-only flows don't pay
+        # PyMuPDF's startup cost - pylint: disable=import-outside-toplevel
+        import fitz  # pylint: disable=import-error
+
         if not os.path.exists(self.pdf_path):
             logger.error("PDF not found at %s", self.pdf_path)
             return None
@@ -77,30 +161,94 @@ class PaperDownloader:
         try:
             logger.info("Extracting text from %s", self.pdf_path)
             document = fitz.open(self.pdf_path)  # pylint: disable=no-member
-            text = ""
 
-            # Extract text from each page
-            for page_num, page in enumerate(document):
-                text += page.get_text()
-                logger.debug("Extracted text from page %d", page_num)
+            # The flags keep plain whitespace handling but skip ligature
+            # preservation, which we don't need for summarization
+            pages = [
+                page.get_text("text", flags=fitz.TEXT_PRESERVE_WHITESPACE)
+                for page in document
+            ]
 
             document.close()
 
-            logger.info("Extracted %d characters from %s", len(text), self.paper_id)
-            return text
+            logger.info("Extracted %d pages from %s", len(pages), self.paper_id)
+            return pages
 
         except (IOError, RuntimeError) as error:
             logger.error("Error extracting text from %s: %s", self.paper_id, error)
             return None
 
+    def extract_text(self) -> Optional[str]:
+        """Extracts text content from the downloaded PDF.
+
+        Returns:
+            The extracted text as a string, or None if extraction fails.
+        """
+        pages = self.extract_pages()
+
+        if pages is None:
+            return None
+
+        text = "".join(pages)
+        logger.info("Extracted %d characters from %s", len(text), self.paper_id)
+        return text
+
+    def _read_cached_text(self) -> Optional[str]:
+        """Reads previously extracted text from disk if still fresh.
+
+        Returns:
+            The cached text, or None if there is no cache or the PDF is
+            newer than the cached text.
+        """
+        if not os.path.exists(self.text_path):
+            return None
+
+        # A PDF downloaded after the text was written invalidates the cache
+        if os.path.exists(self.pdf_path) and os.path.getmtime(
+            self.pdf_path
+        ) > os.path.getmtime(self.text_path):
+            return None
+
+        try:
+            with open(self.text_path, encoding="utf-8") as file:
+                return file.read()
+        except IOError as error:
+            logger.warning("Could not read cached text for %s: %s", self.paper_id, error)
+            return None
+
+    def _write_cached_text(self, text: str) -> None:
+        """Writes extracted text to disk atomically.
+
+        Args:
+            text: The extracted text to cache.
+        """
+        tmp_path = self.text_path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                file.write(text)
+            os.replace(tmp_path, self.text_path)
+        except IOError as error:
+            logger.warning("Could not cache text for %s: %s", self.paper_id, error)
+
     def download_and_extract(self) -> Optional[str]:
         """Downloads PDF and extracts text in one step.
 
+        Extracted text is cached next to the PDF, so repeated runs on
+        the same week's papers skip the download and PyMuPDF pass.
+
         Returns:
             The extracted text, or None if any step fails.
         """
+        cached = self._read_cached_text()
+        if cached is not None:
+            logger.info("Using cached text for %s", self.paper_id)
+            return cached
+
         if self.download_pdf():
-            return self.extract_text()
+            text = self.extract_text()
+            if text:
+                self._write_cached_text(text)
+            return text
         return None
 
 
@@ -121,16 +269,22 @@ def download_papers(paper_ids: list[str]) -> dict[str, str]:
 
     papers_text = {}
 
-    for paper_id in paper_ids:
-        logger.info("Processing paper %s", paper_id)
-        downloader = PaperDownloader(paper_id, save_dir)
-        text = downloader.download_and_extract()
-
-        if text:
-            papers_text[paper_id] = text
-
-        # Be polite to arXiv - wait a bit between downloads
-        time.sleep(3)
+    # Download and extract concurrently; the rate limiter keeps requests
+    # to arXiv spaced out while the network waits overlap.
+    with ThreadPoolExecutor(max_workers=config.DOWNLOAD_WORKERS) as executor:
+        futures = {
+            executor.submit(
+                PaperDownloader(paper_id, save_dir).download_and_extract
+            ): paper_id
+            for paper_id in paper_ids
+        }
+
+        for future in as_completed(futures):
+            paper_id = futures[future]
+            text = future.result()
+
+            if text:
+                papers_text[paper_id] = text
 
     logger.info(
         "Successfully downloaded %d out of %d papers", len(papers_text), len(paper_ids)
@@ -1,13 +1,15 @@
 """Module for scraping paper links from HuggingFace weekly papers page."""
 
 import logging
+import re
 import time
 from typing import Optional
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from src import config
+from src._http import SESSION
 
 
 # Set up logging
@@ -17,6 +19,16 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Matches paper links like href="/papers/2511.11793" in the raw HTML.
+# Links with a fragment (e.g. #community) don't match because the quote
+# must follow the ID directly.
+_PAPER_HREF_RE = re.compile(r'href="/papers/(\d{4}\.\d{4,6})"')
+
+# Only <a href> elements are ever read from the parse tree, so tell the
+# parser to skip building everything else
+_LINKS_ONLY = SoupStrainer("a", href=True)
+
+
 class PaperScraper:
     """Scrapes paper information from HuggingFace weekly papers page.
 
@@ -48,18 +60,14 @@ class PaperScraper:
             requests.RequestException: If there's an error fetching the page.
         """
         try:
-            logger.info(f"Fetching page: {self.url}")
-            response = requests.get(
-                self.url,
-                timeout=config.REQUEST_TIMEOUT,
-                headers={"User-Agent": "Mozilla/5.0"},
-            )
+            logger.info("Fetching page: %s", self.url)
+            response = SESSION.get(self.url, timeout=config.REQUEST_TIMEOUT)
             response.raise_for_status()
             logger.info("Page fetched successfully")
             return response.text
 
         except requests.RequestException as error:
-            logger.error(f"Error fetching page: {error}")
+            logger.error("Error fetching page: %s", error)
             return None
 
     def extract_paper_ids(self, html_content: str) -> list[str]:
@@ -71,8 +79,49 @@ class PaperScraper:
         Returns:
             A list of arXiv paper IDs (e.g., ['2511.11793', '2511.12345']).
         """
-        soup = BeautifulSoup(html_content, "html.parser")
         paper_ids = []
+        seen = set()
+
+        # Fast path: the paper links have a fixed shape, so one pass of a
+        # compiled regex over the raw HTML finds them without building a
+        # parse tree.
+        for match in _PAPER_HREF_RE.finditer(html_content):
+            paper_id = match.group(1)
+
+            # Avoid duplicates (set gives O(1) membership checks)
+            if paper_id not in seen:
+                seen.add(paper_id)
+                paper_ids.append(paper_id)
+                logger.debug("Found paper: %s", paper_id)
+
+            # Stop when we have enough papers
+            if len(paper_ids) >= self.top_n:
+                break
+
+        # Fall back to a full parse in case the markup shape changed
+        if not paper_ids:
+            logger.warning("Regex scan found no papers, falling back to parser")
+            paper_ids = self._extract_paper_ids_soup(html_content)
+
+        logger.info("Extracted %d paper IDs", len(paper_ids))
+        return paper_ids
+
+    def _extract_paper_ids_soup(self, html_content: str) -> list[str]:
+        """Extracts paper IDs by fully parsing the HTML.
+
+        Slower fallback used when the regex scan finds nothing.
+
+        Args:
+            html_content: The HTML content to parse.
+
+        Returns:
+            A list of arXiv paper IDs.
+        """
+        # lxml parses an order of magnitude faster than the pure-Python
+        # stdlib parser, and the strainer keeps only <a href> elements
+        soup = BeautifulSoup(html_content, "lxml", parse_only=_LINKS_ONLY)
+        paper_ids = []
+        seen = set()
 
         # Find all links that match the pattern /papers/XXXXX.XXXXX
         links = soup.find_all("a", href=True)
@@ -88,16 +137,16 @@ class PaperScraper:
                 if "#community" in paper_id:
                     continue
 
-                # Avoid duplicates
-                if paper_id not in paper_ids:
+                # Avoid duplicates (set gives O(1) membership checks)
+                if paper_id not in seen:
+                    seen.add(paper_id)
                     paper_ids.append(paper_id)
-                    logger.info("Found paper: %s", paper_id)
+                    logger.debug("Found paper: %s", paper_id)
 
                 # Stop when we have enough papers
                 if len(paper_ids) >= self.top_n:
                     break
 
-        logger.info("Extracted %d paper IDs", len(paper_ids))
         return paper_ids
 
     def scrape(self) -> list[str]:
@@ -115,7 +164,9 @@ class PaperScraper:
         paper_ids = self.extract_paper_ids(html_content)
 
         if len(paper_ids) < self.top_n:
-            logger.warning(f"Only found {len(paper_ids)} papers, expected {self.top_n}")
+            logger.warning(
+                "Only found %d papers, expected %d", len(paper_ids), self.top_n
+            )
 
         return paper_ids
 
@@ -1,17 +1,19 @@
 """Module for summarizing papers using LLMs via Vertex AI."""
 
+import functools
+import hashlib
 import logging
 import os
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from dotenv import load_dotenv
-from google.cloud import aiplatform
-from langchain_google_vertexai import ChatVertexAI
-from langchain.schema import HumanMessage
 
 from src import config
 from src.text_chunker import chunk_paper_text
 
+if TYPE_CHECKING:
+    from langchain_google_vertexai import ChatVertexAI
+
 
 # Load environment variables
 load_dotenv()
@@ -22,6 +24,48 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Resolve the project once at import instead of per summarizer
+_DEFAULT_PROJECT = os.getenv("GOOGLE_CLOUD_PROJECT")
+
+# Per-request timeout in seconds; this version of the Vertex bindings
+# only accepts a timeout per call, not on the model constructor
+_LLM_TIMEOUT = 60
+
+
+@functools.lru_cache(maxsize=4)
+def get_llm(model_name: str, project_id: str, location: str) -> "ChatVertexAI":
+    """Builds a Vertex AI chat model, cached per configuration.
+
+    aiplatform.init and ChatVertexAI construction both perform
+    credential discovery and channel setup, so one client is shared per
+    (model, project, location) instead of rebuilding it per summarizer.
+
+    Args:
+        model_name: Vertex AI model name to use.
+        project_id: Google Cloud project ID.
+        location: Vertex AI location.
+
+    Returns:
+        A ChatVertexAI client for the given configuration.
+    """
+    # Imported here so scraper-only flows never load the Vertex AI stack
+    # pylint: disable=import-outside-toplevel
+    from google.cloud import aiplatform
+    from langchain_google_vertexai import ChatVertexAI
+
+    aiplatform.init(project=project_id, location=location)
+    logger.info("Initialized Vertex AI for project %s in %s", project_id, location)
+
+    # Retries happen at the client level, so one transient failure only
+    # re-sends the affected request instead of failing the whole paper
+    return ChatVertexAI(
+        model_name=model_name,
+        temperature=0.3,
+        max_output_tokens=2048,
+        max_retries=3,
+    )
+
+
 class PaperSummarizer:
     """Summarizes research papers using map-reduce with LLMs.
 
@@ -49,22 +93,19 @@ class PaperSummarizer:
 
         # Get project ID
         if project_id is None:
-            project_id = os.getenv("GOOGLE_CLOUD_PROJECT")
+            project_id = _DEFAULT_PROJECT
             if not project_id:
                 raise ValueError("GOOGLE_CLOUD_PROJECT not set in environment")
 
         self.project_id = project_id
+        self._llm: Optional["ChatVertexAI"] = None
 
-        # Initialize Vertex AI
-        aiplatform.init(project=self.project_id, location=self.location)
-        logger.info(
-            "Initialized Vertex AI for project %s in %s", self.project_id, self.location
-        )
-
-        # Initialize LLM
-        self.llm = ChatVertexAI(
-            model_name=self.model_name, temperature=0.3, max_output_tokens=2048
-        )
+    @property
+    def llm(self) -> "ChatVertexAI":
+        """The chat model client, created on first use."""
+        if self._llm is None:
+            self._llm = get_llm(self.model_name, self.project_id, self.location)
+        return self._llm
 
     def summarize_chunk(self, chunk: str) -> Optional[str]:
         """Summarizes a single text chunk.
@@ -75,19 +116,57 @@ class PaperSummarizer:
         Returns:
             Summary of the chunk, or None if summarization fails.
         """
+        # pylint: disable=import-outside-toplevel
+        from google.api_core.exceptions import GoogleAPICallError
+        from langchain.schema import HumanMessage
+
         try:
             prompt = config.MAP_PROMPT.format(text=chunk)
             message = HumanMessage(content=prompt)
-            response = self.llm.invoke([message])
+            response = self.llm.invoke([message], timeout=_LLM_TIMEOUT)
             summary = response.content.strip()
 
             logger.info("Summarized chunk (length: %d -> %d)", len(chunk), len(summary))
             return summary
 
-        except Exception as error:
+        except GoogleAPICallError as error:
             logger.error("Error summarizing chunk: %s", error)
             return None
 
+    def summarize_chunks(self, chunks: list[str]) -> list[Optional[str]]:
+        """Summarizes all chunks in one batched LLM call.
+
+        Args:
+            chunks: Text chunks to summarize.
+
+        Returns:
+            A list of summaries aligned with the input chunks. Entries
+            are None for chunks that failed.
+        """
+        # pylint: disable=import-outside-toplevel
+        from langchain.schema import HumanMessage
+
+        messages = [
+            [HumanMessage(content=config.MAP_PROMPT.format(text=chunk))]
+            for chunk in chunks
+        ]
+        responses = self.llm.batch(
+            messages,
+            config={"max_concurrency": 8},
+            return_exceptions=True,
+            timeout=_LLM_TIMEOUT,
+        )
+
+        summaries = []
+        for i, response in enumerate(responses, 1):
+            if isinstance(response, Exception):
+                logger.error("Error summarizing chunk %d: %s", i, response)
+                summaries.append(None)
+            else:
+                summaries.append(response.content.strip())
+
+        return summaries
+
     def combine_summaries(self, summaries: list[str]) -> Optional[str]:
         """Combines multiple chunk summaries into one final summary.
 
@@ -97,24 +176,77 @@ class PaperSummarizer:
         Returns:
             Combined final summary, or None if combination fails.
         """
+        # pylint: disable=import-outside-toplevel
+        from google.api_core.exceptions import GoogleAPICallError
+        from langchain.schema import HumanMessage
+
         try:
             # Join summaries with separators
             combined = "\n\n---\n\n".join(summaries)
-            prompt = config.REDUCE_PROMPT.format(summaries=combined)
+            prompt = config.REDUCE_PROMPT.format(text=combined)
             message = HumanMessage(content=prompt)
-            response = self.llm.invoke([message])
+            response = self.llm.invoke([message], timeout=_LLM_TIMEOUT)
             final_summary = response.content.strip()
 
             logger.info("Combined %d summaries into final summary", len(summaries))
             return final_summary
 
-        except Exception as error:
-            logger.error("Error combining summaries: %s", error)
+        except GoogleAPICallError as error:
+            logger.error(
+                "Error combining summaries (%s): %s", type(error).__name__, error
+            )
             return None
 
+    def _summary_cache_path(self, text: str) -> str:
+        """Builds the cache file path for a paper's summary.
+
+        The key hashes both the model name and the paper text, so a
+        model change or a different paper never hits a stale entry.
+
+        Args:
+            text: Full paper text being summarized.
+
+        Returns:
+            Path to the cached summary file.
+        """
+        key = hashlib.sha256(f"{self.model_name}|{text}".encode()).hexdigest()[:16]
+        model_slug = self.model_name.replace("/", "-")
+        return os.path.join(config.SUMMARIES_DIR, f"{model_slug}-{key}.md")
+
     def summarize_paper(self, text: str) -> Optional[str]:
         """Performs map-reduce summarization on a paper.
 
+        Summaries are cached on disk keyed by model and paper content,
+        so re-running the pipeline on already-seen papers skips the LLM
+        calls entirely.
+
+        Args:
+            text: Full paper text to summarize.
+
+        Returns:
+            Final summary of the paper, or None if summarization fails.
+        """
+        cache_path = self._summary_cache_path(text)
+
+        if os.path.exists(cache_path):
+            logger.info("Using cached summary at %s", cache_path)
+            with open(cache_path, encoding="utf-8") as file:
+                return file.read()
+
+        final_summary = self._run_map_reduce(text)
+
+        if final_summary:
+            os.makedirs(config.SUMMARIES_DIR, exist_ok=True)
+            tmp_path = cache_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                file.write(final_summary)
+            os.replace(tmp_path, cache_path)
+
+        return final_summary
+
+    def _run_map_reduce(self, text: str) -> Optional[str]:
+        """Runs the uncached map-reduce summarization.
+
         Args:
             text: Full paper text to summarize.
 
@@ -132,12 +264,13 @@ class PaperSummarizer:
 
         logger.info("Created %d chunks", len(chunks))
 
-        # Step 2: Summarize each chunk (MAP phase)
-        chunk_summaries = []
-        for i, chunk in enumerate(chunks, 1):
-            logger.info("Summarizing chunk %d/%d", i, len(chunks))
-            summary = self.summarize_chunk(chunk)
+        # Step 2: Summarize chunks in one batched call (MAP phase) so the
+        # client pipelines the requests instead of one round-trip per chunk
+        logger.info("Summarizing %d chunks in a batch", len(chunks))
+        results = self.summarize_chunks(chunks)
 
+        chunk_summaries = []
+        for i, summary in enumerate(results, 1):
             if summary:
                 chunk_summaries.append(summary)
             else: